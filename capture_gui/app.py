@@ -366,6 +366,8 @@ class App(QtWidgets.QWidget):
         # Remove pointer for memory when closed
         self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
         self.settingfile = self._ensure_config_exist()
+        # the inputs as last read from or written to the setting file
+        self._stored_inputs = None
         self.plugins = {"app": list(),
                         "config": list()}
 
@@ -425,6 +427,8 @@ class App(QtWidgets.QWidget):
     def apply(self):
         """Run capture action with current settings"""
 
+        self._interpret_text()
+
         valid = self.validate()
         if not valid:
             return
@@ -556,6 +560,20 @@ class App(QtWidgets.QWidget):
 
         return True
 
+    def _interpret_text(self):
+        """Commit values still being typed in the plug-ins' spinboxes
+
+        Keyboard tracking is disabled on the spinboxes so their value is
+        only updated on Enter or focus out, e.g. capturing directly after
+        typing a width would otherwise use the previous width.
+
+        :return: None
+        """
+
+        for widget in self._get_plugin_widgets():
+            for spinbox in widget.findChildren(QtWidgets.QAbstractSpinBox):
+                spinbox.interpretText()
+
     def get_outputs(self):
         """
         Return the settings for a capture as currently set in the  Application.
@@ -650,11 +668,17 @@ class App(QtWidgets.QWidget):
         inputs = self.get_inputs(as_preset=False)
         path = self.settingfile
 
+        if inputs == self._stored_inputs:
+            log.debug("Skipping unchanged JSON file: {0}".format(path))
+            return
+
         with open(path, "w") as f:
             log.debug("Writing JSON file: {0}".format(path))
             json.dump(inputs, f, sort_keys=True,
                       indent=4, separators=(',', ': '))
 
+        self._stored_inputs = inputs
+
     def _read_widget_configuration(self):
         """Read the stored widget inputs"""
 
@@ -671,6 +695,8 @@ class App(QtWidgets.QWidget):
             except ValueError as error:
                 log.error(str(error))
 
+        self._stored_inputs = inputs
+
         return inputs
 
     def _get_plugin_widgets(self):
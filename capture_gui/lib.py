@@ -181,6 +181,13 @@ def get_current_renderlayer():
     return cmds.editRenderLayerGlobals(query=True, currentRenderLayer=True)
 
 
+def get_current_sound():
+    """Return the sound node active in Maya's time slider, if any"""
+    gPlaybackSlider = mel.eval("global string $gPlayBackSlider; "
+                               "$gPlayBackSlider = $gPlayBackSlider;")
+    return cmds.timeControl(gPlaybackSlider, query=True, sound=True) or None
+
+
 def get_plugin_shapes():
     """
     Get all currently available plugin shapes
@@ -384,6 +391,17 @@ def no_undo():
         cmds.undoInfo(stateWithoutFlush=True)
 
 
+@contextlib.contextmanager
+def signals_blocked(*objects):
+    """Block the Qt signals of all objects during the context"""
+    states = [obj.blockSignals(True) for obj in objects]
+    try:
+        yield
+    finally:
+        for obj, state in zip(objects, states):
+            obj.blockSignals(state)
+
+
 def get_maya_main_window():
     """
     Get the main Maya window as a QtGui.QMainWindow instance
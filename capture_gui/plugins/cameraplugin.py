@@ -1,9 +1,14 @@
+import logging
+
 import maya.cmds as cmds
+import maya.OpenMaya as om
 from capture_gui.vendor.Qt import QtCore, QtWidgets
 
 import capture_gui.lib as lib
 import capture_gui.plugin
 
+log = logging.getLogger("Camera")
+
 
 class CameraPlugin(capture_gui.plugin.Plugin):
     """Camera widget.
@@ -18,6 +23,11 @@ class CameraPlugin(capture_gui.plugin.Plugin):
     def __init__(self, parent=None):
         super(CameraPlugin, self).__init__(parent=parent)
 
+        # Camera transforms of the scene, this is only cached while the
+        # callbacks which clear it on changes to the cameras are registered
+        self._cameras_cache = None
+        self._callbacks = list()
+
         self._layout = QtWidgets.QHBoxLayout()
         self._layout.setContentsMargins(5, 0, 5, 0)
         self.setLayout(self._layout)
@@ -54,18 +64,63 @@ class CameraPlugin(capture_gui.plugin.Plugin):
 
     def select_camera(self, cam):
         if cam:
-            # Ensure long name
-            cameras = cmds.ls(cam, long=True)
-            if not cameras:
-                return
-            cam = cameras[0]
-
-            # Find the index in the list
-            for i in range(self.cameras.count()):
-                value = str(self.cameras.itemText(i))
-                if value == cam:
-                    self.cameras.setCurrentIndex(i)
+            # Find the index in the list, the current selection is already
+            # a long name so only query Maya when it is not found directly
+            index = self.cameras.findText(cam)
+            if index == -1:
+                # Ensure long name
+                cameras = cmds.ls(cam, long=True)
+                if not cameras:
                     return
+                index = self.cameras.findText(cameras[0])
+
+            if index != -1:
+                self.cameras.setCurrentIndex(index)
+
+    def initialize(self):
+        """Register callbacks to clear the cached cameras on scene changes"""
+
+        clear = self._clear_cameras_cache
+        self._callbacks = [
+            om.MDGMessage.addNodeAddedCallback(clear, "camera"),
+            om.MDGMessage.addNodeRemovedCallback(clear, "camera"),
+            om.MDagMessage.addAllDagChangesCallback(clear),
+            om.MEventMessage.addEventCallback("NameChanged", clear)
+        ]
+
+    def uninitialize(self):
+        for callback in self._callbacks:
+            try:
+                om.MMessage.removeCallback(callback)
+            except RuntimeError as error:
+                log.error("Encounter error : {}".format(error))
+
+        self._callbacks = list()
+        self._clear_cameras_cache()
+
+    def _clear_cameras_cache(self, *args):
+        self._cameras_cache = None
+
+    def get_cameras(self):
+        """Return the full paths of all camera transforms in the scene.
+
+        Returns:
+            list: The camera transforms
+
+        """
+
+        if self._cameras_cache is not None:
+            return self._cameras_cache
+
+        cam_shapes = cmds.ls(type="camera")
+        cam_transforms = cmds.listRelatives(cam_shapes,
+                                            parent=True,
+                                            fullPath=True) or []
+
+        if self._callbacks:
+            self._cameras_cache = cam_transforms
+
+        return cam_transforms
 
     def validate(self):
 
@@ -84,7 +139,7 @@ class CameraPlugin(capture_gui.plugin.Plugin):
         """Return currently selected camera from combobox."""
 
         idx = self.cameras.currentIndex()
-        camera = str(self.cameras.itemText(idx)) if idx != -1 else None
+        camera = self.cameras.itemText(idx) if idx != -1 else None
 
         return {"camera": camera}
 
@@ -111,21 +166,21 @@ class CameraPlugin(capture_gui.plugin.Plugin):
             if index != -1:
                 camera = self.cameras.currentText()
 
-        self.cameras.blockSignals(True)
-
-        # Update the list with available cameras
-        self.cameras.clear()
-
-        cam_shapes = cmds.ls(type="camera")
-        cam_transforms = cmds.listRelatives(cam_shapes,
-                                            parent=True,
-                                            fullPath=True)
-        self.cameras.addItems(cam_transforms)
-
-        # If original selection, try to reselect
-        self.select_camera(camera)
-
-        self.cameras.blockSignals(False)
+        cam_transforms = self.get_cameras()
+
+        with lib.signals_blocked(self.cameras):
+            # Update the list with available cameras, only when it changed
+            # to avoid rebuilding the combobox on each refresh
+            current = [self.cameras.itemText(i)
+                       for i in range(self.cameras.count())]
+            if current != cam_transforms:
+                self.cameras.setUpdatesEnabled(False)
+                self.cameras.clear()
+                self.cameras.addItems(cam_transforms)
+                self.cameras.setUpdatesEnabled(True)
+
+            # If original selection, try to reselect
+            self.select_camera(camera)
 
         # If camera changed emit signal
         if cam != self.get_outputs()['camera']:
@@ -15,6 +15,11 @@ class CodecPlugin(capture_gui.plugin.Plugin):
     section = "config"
     order = 50
 
+    # Formats and compressions per format, these are the same for the
+    # whole session
+    _formats_cache = None
+    _compressions_cache = dict()
+
     def __init__(self, parent=None):
         super(CodecPlugin, self).__init__(parent=parent)
 
@@ -56,17 +61,63 @@ class CodecPlugin(capture_gui.plugin.Plugin):
         self.quality.valueChanged.connect(self.options_changed)
 
     def refresh(self):
-        formats = sorted(lib.list_formats())
-        self.format.clear()
-        self.format.addItems(formats)
+        """Refresh the available formats.
+
+        A currentIndexChanged signal is only emitted for the format
+        combobox when the format is different at the end of the refresh.
+
+        """
+
+        previous = self.format.currentText()
+        formats = self.list_formats()
+
+        with lib.signals_blocked(self.format):
+            self.format.clear()
+            self.format.addItems(formats)
+
+            # Preserve the original selection when still available
+            index = self.format.findText(previous)
+            if index != -1:
+                self.format.setCurrentIndex(index)
+
+        if self.format.currentText() != previous:
+            index = self.format.currentIndex()
+            self.format.currentIndexChanged.emit(index)
 
     def on_format_changed(self):
         """Refresh the available compressions."""
 
         format = self.format.currentText()
-        compressions = lib.list_compressions(format)
-        self.compression.clear()
-        self.compression.addItems(compressions)
+        compressions = self.list_compressions(format)
+
+        # The format's change already emits options_changed
+        with lib.signals_blocked(self.compression):
+            self.compression.clear()
+            self.compression.addItems(compressions)
+
+    def list_formats(self):
+        """List the sorted playblast formats
+
+        The result is cached on the class.
+
+        """
+        cls = type(self)
+        if cls._formats_cache is None:
+            cls._formats_cache = sorted(lib.list_formats())
+
+        return list(cls._formats_cache)
+
+    def list_compressions(self, format):
+        """List the compressions available for the format
+
+        The result is cached on the class per format.
+
+        """
+        cache = type(self)._compressions_cache
+        if format not in cache:
+            cache[format] = lib.list_compressions(format) or []
+
+        return list(cache[format])
 
     def get_outputs(self):
         """
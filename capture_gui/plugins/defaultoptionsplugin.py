@@ -1,6 +1,17 @@
-import capture
+import capture_gui.lib as lib
 import capture_gui.plugin
 
+# Camera options which are always overridden for the playblast
+CAMERA_OPTIONS = {"overscan": 1.0,
+                  "displayFieldChart": False,
+                  "displayFilmGate": False,
+                  "displayFilmOrigin": False,
+                  "displayFilmPivot": False,
+                  "displayGateMask": False,
+                  "displayResolution": False,
+                  "displaySafeAction": False,
+                  "displaySafeTitle": False}
+
 
 class DefaultOptionsPlugin(capture_gui.plugin.Plugin):
     """Invisible Plugin that supplies a set of constant default values to the gui.
@@ -24,22 +35,13 @@ class DefaultOptionsPlugin(capture_gui.plugin.Plugin):
         outputs = dict()
 
         # use active sound track
-        scene = capture.parse_active_scene()
-        outputs['sound'] = scene['sound']
+        outputs['sound'] = lib.get_current_sound()
 
         # override default settings
         outputs['show_ornaments'] = True  # never show HUD or overlays
 
         # override camera options
-        outputs['camera_options'] = dict()
-        outputs['camera_options']['overscan'] = 1.0
-        outputs['camera_options']['displayFieldChart'] = False
-        outputs['camera_options']['displayFilmGate'] = False
-        outputs['camera_options']['displayFilmOrigin'] = False
-        outputs['camera_options']['displayFilmPivot'] = False
-        outputs['camera_options']['displayGateMask'] = False
-        outputs['camera_options']['displayResolution'] = False
-        outputs['camera_options']['displaySafeAction'] = False
-        outputs['camera_options']['displaySafeTitle'] = False
+        # copy as the outputs are merged with other plug-ins' outputs
+        outputs['camera_options'] = dict(CAMERA_OPTIONS)
 
         return outputs
@@ -79,14 +79,12 @@ class GenericPlugin(capture_gui.plugin.Plugin):
         :return: 
         """
 
-        inputs = self.get_inputs(as_preset=False)
         outputs = dict()
-        outputs['off_screen'] = inputs['off_screen']
+        outputs['off_screen'] = self.widgets["off_screen"].isChecked()
 
-        import capture_gui.lib
-
-        # Get isolate view members of the active panel
-        if inputs['isolate_view']:
+        # Get isolate view members of the active panel, only query Maya
+        # when isolate view is actually enabled
+        if self.widgets["isolate_view"].isChecked():
             panel = capture_gui.lib.get_active_editor()
             filter_set = mc.modelEditor(panel, query=True, viewObjects=True)
             isolate = mc.sets(filter_set, query=True) if filter_set else None
@@ -1,6 +1,8 @@
 import os
+import json
+import stat
 import logging
-from functools import partial
+from collections import deque
 
 from capture_gui.vendor.Qt import QtCore, QtWidgets
 from capture_gui import plugin, lib
@@ -8,35 +10,94 @@ from capture_gui import tokens
 
 log = logging.getLogger("IO")
 
+try:
+    # Python 2
+    string_types = basestring
+except NameError:
+    # Python 3
+    string_types = str
+
+
+def _recent_playblasts_file():
+    """Return the file the recent playblasts are stored in
+
+    The recent playblasts are stored separately from the widget settings.
+    The path is resolved on use to avoid expanding the user's home folder
+    on import.
+
+    """
+    return os.path.join(os.path.expanduser("~"),
+                        "CaptureGUI",
+                        "recent_playblasts.json")
+
+
+def _populate_layout(layout, items, margins=(0, 0, 0, 0)):
+    """Set the margins of `layout` and add the widgets and layouts to it"""
+    layout.setContentsMargins(*margins)
+    for item in items:
+        if isinstance(item, QtWidgets.QLayout):
+            layout.addLayout(item)
+        else:
+            layout.addWidget(item)
+    return layout
+
+
+def _hbox(*items, **kwargs):
+    """Return a QHBoxLayout containing `items`"""
+    return _populate_layout(QtWidgets.QHBoxLayout(), items, **kwargs)
+
+
+def _vbox(*items, **kwargs):
+    """Return a QVBoxLayout containing `items`"""
+    return _populate_layout(QtWidgets.QVBoxLayout(), items, **kwargs)
+
+
+def _is_file(path):
+    """Return whether `path` is an existing file using a single stat call"""
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except OSError:
+        return False
+
 
 class IoAction(QtWidgets.QAction):
 
+    # Shared between all actions, created on first use since it requires
+    # a running QApplication
+    _icon_provider = None
+
     def __init__(self, parent, filepath):
         super(IoAction, self).__init__(parent)
 
-        action_label = os.path.basename(filepath)
+        # QFileInfo only queries the file system once it is required
+        self._info = QtCore.QFileInfo(filepath)
 
-        self.setText(action_label)
+        self.setText(self._info.fileName())
+        self.setToolTip(filepath)
         self.setData(filepath)
 
-        # check if file exists and disable when false
-        self.setEnabled(os.path.isfile(filepath))
-
-        # get icon from file
-        info = QtCore.QFileInfo(filepath)
-        icon_provider = QtWidgets.QFileIconProvider()
-        self.setIcon(icon_provider.icon(info))
+    def needs_icon(self):
+        """Return whether the file icon still has to be resolved"""
+        # Missing files are shown disabled and need no file icon
+        return self.isEnabled() and self.icon().isNull()
 
-        self.triggered.connect(self.open_object_data)
+    def update_icon(self):
+        """Set the icon of the action from its file"""
+        self.setIcon(self.icon_provider().icon(self._info))
 
-    def open_object_data(self):
-        lib.open_file(self.data())
+    @classmethod
+    def icon_provider(cls):
+        """Return the file icon provider shared by all actions"""
+        if cls._icon_provider is None:
+            cls._icon_provider = QtWidgets.QFileIconProvider()
+        return cls._icon_provider
 
 
 class IoPlugin(plugin.Plugin):
-    """Codec widget.
+    """Save widget.
 
-    Allows to set format, compression and quality.
+    Allows to set the output path, whether to view the result and to play
+    back recent playblasts.
 
     """
     id = "IO"
@@ -48,22 +109,32 @@ class IoPlugin(plugin.Plugin):
     def __init__(self, parent=None):
         super(IoPlugin, self).__init__(parent=parent)
 
-        self.recent_playblasts = list()
+        self.recent_playblasts = deque(maxlen=self.max_recent_playblasts)
+        self._recent_set = set()
+        self._exists_cache = dict()
 
-        self._layout = QtWidgets.QVBoxLayout()
-        self._layout.setContentsMargins(0, 0, 0, 0)
-        self.setLayout(self._layout)
+        # File icons are resolved one per event loop iteration after the
+        # recent playblasts menu is shown so opening it never waits on them
+        self._icon_queue = list()
+        self._icon_timer = QtCore.QTimer(self)
+        self._icon_timer.setSingleShot(True)
+        self._icon_timer.setInterval(0)
+        self._icon_timer.timeout.connect(self._resolve_next_icon)
+
+        # The token menu is built on first use and reused until the
+        # registered tokens change
+        self._token_menu = None
+        self._token_menu_tokens = None
 
         # region Checkboxes
         self.save_file = QtWidgets.QCheckBox(text="Save")
         self.open_viewer = QtWidgets.QCheckBox(text="View when finished")
         self.raw_frame_numbers = QtWidgets.QCheckBox(text="Raw frame numbers")
 
-        checkbox_hlayout = QtWidgets.QHBoxLayout()
-        checkbox_hlayout.setContentsMargins(5, 0, 5, 0)
-        checkbox_hlayout.addWidget(self.save_file)
-        checkbox_hlayout.addWidget(self.open_viewer)
-        checkbox_hlayout.addWidget(self.raw_frame_numbers)
+        checkbox_hlayout = _hbox(self.save_file,
+                                 self.open_viewer,
+                                 self.raw_frame_numbers,
+                                 margins=(5, 0, 5, 0))
         checkbox_hlayout.addStretch(True)
         # endregion Checkboxes
 
@@ -79,26 +150,25 @@ class IoPlugin(plugin.Plugin):
         self.file_path.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self.file_path.customContextMenuRequested.connect(self.show_token_menu)
 
-        path_hlayout = QtWidgets.QHBoxLayout()
-        path_hlayout.setContentsMargins(0, 0, 0, 0)
         path_label = QtWidgets.QLabel("Path:")
         path_label.setFixedWidth(30)
 
-        path_hlayout.addWidget(path_label)
-        path_hlayout.addWidget(self.file_path)
-        path_hlayout.addWidget(self.browse)
-        self.path_widget.setLayout(path_hlayout)
+        self.path_widget.setLayout(_hbox(path_label,
+                                         self.file_path,
+                                         self.browse))
         # endregion Path
 
         # region Recent Playblast
+        # The menu is only created once the first playblast is added
         self.play_recent = QtWidgets.QPushButton("Play recent playblast")
-        self.recent_menu = QtWidgets.QMenu()
-        self.play_recent.setMenu(self.recent_menu)
+        self.play_recent.setEnabled(False)
+        self.recent_menu = None
         # endregion Recent Playblast
 
-        self._layout.addLayout(checkbox_hlayout)
-        self._layout.addWidget(self.path_widget)
-        self._layout.addWidget(self.play_recent)
+        self._layout = _vbox(checkbox_hlayout,
+                             self.path_widget,
+                             self.play_recent)
+        self.setLayout(self._layout)
 
         # Signals  / connections
         self.browse.clicked.connect(self.show_browse_dialog)
@@ -145,33 +215,194 @@ class IoPlugin(plugin.Plugin):
         :return: None 
         """
 
-        # If item already in the recent playblasts remove it so we are
-        # sure to add it as the new first most-recent
-        try:
+        self._ensure_recent_menu()
+
+        # The menu's actions are kept in the same order as the recent
+        # playblasts so only the changed entries have to be updated.
+        if item in self._recent_set:
+            # If item already in the recent playblasts remove it so we are
+            # sure to add it as the new first most-recent
             self.recent_playblasts.remove(item)
-        except ValueError:
-            pass
+            for action in self.recent_menu.actions():
+                if action.data() == item:
+                    self._delete_recent_action(action)
+                    break
+
+        elif len(self.recent_playblasts) == self.max_recent_playblasts:
+            # Ensure the playblast list is never longer than maximum amount
+            # by removing the oldest entry that is at the end of the list
+            oldest = self.recent_playblasts.pop()
+            self._recent_set.discard(oldest)
+            self._delete_recent_action(self.recent_menu.actions()[-1])
 
         # Add as first in the recent playblasts
-        self.recent_playblasts.insert(0, item)
+        self.recent_playblasts.appendleft(item)
+        self._recent_set.add(item)
+        actions = self.recent_menu.actions()
+        first = actions[0] if actions else None
+        self.recent_menu.insertAction(first, IoAction(parent=self,
+                                                      filepath=item))
+
+    def _bulk_load_playblasts(self, items):
+        """Add multiple items to the previous playblast menu at once
+
+        The menu is rebuilt only once. The items are ordered from most to
+        least recent and are placed before the current recent playblasts.
+
+        :param items: full paths to playblast files
+        :type items: list
+
+        :return: None
+        """
+
+        if not items:
+            return
+
+        playblasts = list()
+        for item in list(items) + list(self.recent_playblasts):
+            if item not in playblasts:
+                playblasts.append(item)
+        del playblasts[self.max_recent_playblasts:]
+
+        self._ensure_recent_menu()
+        for action in self.recent_menu.actions():
+            self._delete_recent_action(action)
+
+        self.recent_playblasts.clear()
+        self.recent_playblasts.extend(playblasts)
+        self._recent_set = set(playblasts)
+        for playblast in playblasts:
+            self.recent_menu.addAction(IoAction(parent=self,
+                                                filepath=playblast))
+
+    def _ensure_recent_menu(self):
+        """Create the recent playblasts menu on first use"""
+
+        if self.recent_menu is not None:
+            return
+
+        self.recent_menu = QtWidgets.QMenu()
+
+        # Show the full path of the playblasts as tooltip (Qt 5.1+)
+        if hasattr(self.recent_menu, "setToolTipsVisible"):
+            self.recent_menu.setToolTipsVisible(True)
+
+        self.recent_menu.triggered.connect(self.on_recent_triggered)
+        self.recent_menu.aboutToShow.connect(self.on_recent_about_to_show)
+        self.play_recent.setMenu(self.recent_menu)
+        self.play_recent.setEnabled(True)
+
+    def _delete_recent_action(self, action):
+        """Remove the action from the recent playblasts menu and delete it"""
+        if action in self._icon_queue:
+            self._icon_queue.remove(action)
+        self.recent_menu.removeAction(action)
+        action.setParent(None)
+        action.deleteLater()
 
-        # Ensure the playblast list is never longer than maximum amount
-        # by removing the older entries that are at the end of the list
-        if len(self.recent_playblasts) > self.max_recent_playblasts:
-            del self.recent_playblasts[self.max_recent_playblasts:]
+    def on_recent_about_to_show(self):
+        """Update the enabled state of the recent playblasts to be shown
 
-        # Rebuild the actions menu
-        self.recent_menu.clear()
-        for playblast in self.recent_playblasts:
-            action = IoAction(parent=self, filepath=playblast)
-            self.recent_menu.addAction(action)
+        The files are only checked once the menu is actually displayed
+        and the result is cached until the next playblast finishes. The
+        file icons are queued to be resolved after the menu is shown.
+
+        :return: None
+        """
+
+        for action in self.recent_menu.actions():
+            playblast = action.data()
+            exists = self._exists_cache.get(playblast)
+            if exists is None:
+                exists = _is_file(playblast)
+                self._exists_cache[playblast] = exists
+
+            action.setEnabled(exists)
+            if action.needs_icon() and action not in self._icon_queue:
+                self._icon_queue.append(action)
+
+        if self._icon_queue:
+            self._icon_timer.start()
+
+    def _resolve_next_icon(self):
+        """Set the file icon of the next queued recent playblast action"""
+
+        if not self._icon_queue:
+            return
+
+        action = self._icon_queue.pop(0)
+        action.update_icon()
+
+        if self._icon_queue:
+            self._icon_timer.start()
+
+    def on_recent_triggered(self, action):
+        """Open the playblast of the triggered recent playblast action"""
+        lib.open_file(action.data())
 
     def on_playblast_finished(self, options):
         """Take action after the play blast is done"""
         playblast_file = options['filename']
         if not playblast_file:
             return
+
+        # A new playblast could have created or overwritten any of the
+        # recent files so their existence needs to be checked again
+        self._exists_cache.clear()
         self.add_playblast(playblast_file)
+        self._store_recent_playblasts()
+
+    def initialize(self):
+        self._read_recent_playblasts()
+
+    def _read_recent_playblasts(self):
+        """Load the recent playblasts stored by a previous session"""
+
+        path = _recent_playblasts_file()
+        if not os.path.isfile(path):
+            return
+
+        try:
+            playblasts = lib.load_json(path)
+        except (IOError, OSError, ValueError) as error:
+            log.error("Unable to read recent playblasts from "
+                      "{0}: {1}".format(path, error))
+            return
+
+        if (not isinstance(playblasts, list) or
+                not all(isinstance(item, string_types) for item in playblasts)):
+            log.error("Recent playblasts in {0} are not a list "
+                      "of file paths".format(path))
+            return
+
+        self._bulk_load_playblasts(playblasts)
+
+    def _store_recent_playblasts(self):
+        """Write the recent playblasts to disk for the next session
+
+        The file is written next to the destination first and then moved
+        in place so an interrupted write never leaves a corrupt file.
+
+        :return: None
+        """
+
+        path = _recent_playblasts_file()
+        temp_path = path + ".tmp"
+        try:
+            directory = os.path.dirname(path)
+            if not os.path.exists(directory):
+                os.makedirs(directory)
+
+            with open(temp_path, "w") as f:
+                json.dump(list(self.recent_playblasts), f, indent=4)
+
+            # Windows can't rename onto an existing file
+            if os.name == "nt" and os.path.exists(path):
+                os.remove(path)
+            os.rename(temp_path, path)
+        except (IOError, OSError) as error:
+            log.warning("Unable to store recent playblasts in "
+                        "{0}: {1}".format(path, error))
 
     def get_outputs(self):
         """
@@ -181,34 +412,23 @@ class IoPlugin(plugin.Plugin):
         :rtype: dict
         """
 
-        output = {"filename": None,
-                  "raw_frame_numbers": self.raw_frame_numbers.isChecked(),
-                  "viewer": self.open_viewer.isChecked()}
-
-        save = self.save_file.isChecked()
-        if not save:
-            return output
-
         # get path, if nothing is set fall back to default
         # project/images/playblast
-        path = self.file_path.text()
-        if not path:
-            path = lib.default_output()
-
-        output["filename"] = path
+        filename = None
+        if self.save_file.isChecked():
+            filename = self.file_path.text() or lib.default_output()
 
-        return output
+        return {"filename": filename,
+                "raw_frame_numbers": self.raw_frame_numbers.isChecked(),
+                "viewer": self.open_viewer.isChecked()}
 
     def get_inputs(self, as_preset):
+        # The recent playblasts are stored in `_recent_playblasts_file()`
         inputs = {"name": self.file_path.text(),
                   "save_file": self.save_file.isChecked(),
                   "open_finished": self.open_viewer.isChecked(),
-                  "recent_playblasts": self.recent_playblasts,
                   "raw_frame_numbers": self.raw_frame_numbers.isChecked()}
 
-        if as_preset:
-            inputs["recent_playblasts"] = []
-
         return inputs
 
     def apply_inputs(self, settings):
@@ -217,16 +437,30 @@ class IoPlugin(plugin.Plugin):
         save_file = settings.get("save_file", True)
         open_finished = settings.get("open_finished", True)
         raw_frame_numbers = settings.get("raw_frame_numbers", False)
+        # Recent playblasts stored by previous versions in the settings
         previous_playblasts = settings.get("recent_playblasts", [])
 
-        self.save_file.setChecked(save_file)
-        self.open_viewer.setChecked(open_finished)
-        self.raw_frame_numbers.setChecked(raw_frame_numbers)
-
-        for playblast in reversed(previous_playblasts):
-            self.add_playblast(playblast)
+        # Block the signals of the widgets while applying the settings so
+        # the changes are processed once instead of once per widget
+        with lib.signals_blocked(self.save_file,
+                                 self.open_viewer,
+                                 self.raw_frame_numbers,
+                                 self.file_path):
+            self.save_file.setChecked(save_file)
+            self.open_viewer.setChecked(open_finished)
+            self.raw_frame_numbers.setChecked(raw_frame_numbers)
+            self.file_path.setText(directory)
+
+        if previous_playblasts:
+            # The playblasts read from the recent playblasts file are newer
+            # than the ones in the settings so they keep their positions
+            playblasts = list(self.recent_playblasts)
+            playblasts.extend(previous_playblasts)
+            self._bulk_load_playblasts(playblasts)
+            self._store_recent_playblasts()
 
-        self.file_path.setText(directory)
+        self.on_save_changed()
+        self.options_changed.emit()
 
     def token_menu(self):
         """
@@ -236,19 +470,32 @@ class IoPlugin(plugin.Plugin):
         :rtype: QtWidgets.QMenu
         """
         menu = QtWidgets.QMenu(self)
-        registered_tokens = tokens.list_tokens()
 
-        for token, value in registered_tokens.items():
-            label = "{} \t{}".format(token, value['label'])
+        for token, token_label in tokens.list_token_labels():
+            label = "{} \t{}".format(token, token_label)
             action = QtWidgets.QAction(label, menu)
-            fn = partial(self.file_path.insert, token)
-            action.triggered.connect(fn)
+            action.setData(token)
             menu.addAction(action)
 
+        menu.triggered.connect(self.on_token_triggered)
+
         return menu
 
+    def on_token_triggered(self, action):
+        """Insert the token of the triggered token action"""
+        self.file_path.insert(action.data())
+
     def show_token_menu(self, pos):
         """Show custom manu on position of widget"""
-        menu = self.token_menu()
+
+        # (Re)build the menu when the registered tokens have changed, the
+        # cached token labels are only replaced when the registry changes
+        token_labels = tokens.list_token_labels()
+        if token_labels is not self._token_menu_tokens:
+            if self._token_menu is not None:
+                self._token_menu.deleteLater()
+            self._token_menu = self.token_menu()
+            self._token_menu_tokens = token_labels
+
         globalpos = QtCore.QPoint(self.file_path.mapToGlobal(pos))
-        menu.exec_(globalpos)
+        self._token_menu.exec_(globalpos)
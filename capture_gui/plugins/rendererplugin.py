@@ -20,16 +20,14 @@ class RendererPlugin(capture_gui.plugin.Plugin):
         layout.setContentsMargins(0, 0, 0, 0)
         self.setLayout(layout)
 
-        # Get active renderers for viewport
-        self._renderers = self.get_renderers()
+        self._renderers = dict()
 
         # Create list of renderers
         self.renderers = QtWidgets.QComboBox()
-        self.renderers.addItems(self._renderers.keys())
-
         layout.addWidget(self.renderers)
 
-        self.apply_inputs(self.get_defaults())
+        # Get active renderers for viewport
+        self.refresh_renderers()
 
         # Signals
         self.renderers.currentIndexChanged.connect(self.options_changed)
@@ -48,6 +46,21 @@ class RendererPlugin(capture_gui.plugin.Plugin):
 
         return renderer
 
+    def refresh_renderers(self):
+        """Query the available renderers again and update the list"""
+
+        current = self._renderers.get(self.renderers.currentText())
+
+        self._renderers = self.get_renderers()
+
+        with lib.signals_blocked(self.renderers):
+            self.renderers.clear()
+            self.renderers.addItems(self._renderers.keys())
+
+        if current is None:
+            current = self.get_defaults()["rendererName"]
+        self.apply_inputs({"rendererName": current})
+
     def get_renderers(self):
         """Collect all available renderers for playblast"""
         active_editor = lib.get_active_editor()
@@ -1,12 +1,14 @@
-import math
-from functools import partial
+import logging
 
 import maya.cmds as cmds
+import maya.OpenMaya as om
 from capture_gui.vendor.Qt import QtCore, QtWidgets
 
 import capture_gui.lib as lib
 import capture_gui.plugin
 
+log = logging.getLogger("Resolution")
+
 
 class ResolutionPlugin(capture_gui.plugin.Plugin):
     """Resolution widget.
@@ -24,9 +26,24 @@ class ResolutionPlugin(capture_gui.plugin.Plugin):
     ScaleRenderSettings = "From Render Settings"
     ScaleCustom = "Custom"
 
+    PercentPresets = (0.25, 0.5, 0.75, 1.0, 2.0)
+
     def __init__(self, parent=None):
         super(ResolutionPlugin, self).__init__(parent=parent)
 
+        # Width and height of the render settings, this is only cached while
+        # the callbacks which clear it on changes are registered
+        self._render_resolution = None
+        self._scene_callbacks = list()
+        self._node_callback = None
+
+        # Coalesce bursts of value changes (e.g. typing or dragging the
+        # spinboxes) into a single update of the resulting resolution
+        self._resolution_timer = QtCore.QTimer(self)
+        self._resolution_timer.setSingleShot(True)
+        self._resolution_timer.setInterval(0)
+        self._resolution_timer.timeout.connect(self.update_resolution)
+
         self._layout = QtWidgets.QVBoxLayout()
         self._layout.setContentsMargins(0, 0, 0, 0)
         self.setLayout(self._layout)
@@ -52,12 +69,14 @@ class ResolutionPlugin(capture_gui.plugin.Plugin):
         self.width.setMinimum(0)
         self.width.setMaximum(99999)
         self.width.setValue(1920)
+        self.width.setKeyboardTracking(False)
         heigth_label = QtWidgets.QLabel("Height")
         heigth_label.setFixedWidth(40)
         self.height = QtWidgets.QSpinBox()
         self.height.setMinimum(0)
         self.height.setMaximum(99999)
         self.height.setValue(1080)
+        self.height.setKeyboardTracking(False)
 
         resolution_layout.addWidget(width_label)
         resolution_layout.addWidget(self.width)
@@ -73,14 +92,16 @@ class ResolutionPlugin(capture_gui.plugin.Plugin):
         self.percent.setMinimum(0.01)
         self.percent.setValue(1.0)  # default value
         self.percent.setSingleStep(0.05)
+        self.percent.setKeyboardTracking(False)
 
         self.percent_presets = QtWidgets.QHBoxLayout()
         self.percent_presets.setSpacing(4)
-        for value in [0.25, 0.5, 0.75, 1.0, 2.0]:
+        for value in self.PercentPresets:
             btn = QtWidgets.QPushButton(str(value))
             self.percent_presets.addWidget(btn)
             btn.setFixedWidth(35)
-            btn.clicked.connect(partial(self.percent.setValue, value))
+            btn.setProperty("percent", value)
+            btn.clicked.connect(self.on_percent_preset)
 
         self.percent_layout = QtWidgets.QHBoxLayout()
         self.percent_layout.addWidget(self.percent_label)
@@ -95,7 +116,7 @@ class ResolutionPlugin(capture_gui.plugin.Plugin):
 
         # refresh states
         self.on_mode_changed()
-        self.on_resolution_changed()
+        self.update_resolution()
 
         # connect signals
         self.mode.currentIndexChanged.connect(self.on_mode_changed)
@@ -122,32 +143,136 @@ class ResolutionPlugin(capture_gui.plugin.Plugin):
             self.height.setEnabled(True)
             self.resolution.show()
 
+    def on_percent_preset(self):
+        """Set the percentage stored on the clicked preset button"""
+        self.percent.setValue(self.sender().property("percent"))
+
+    def initialize(self):
+        """Register callbacks to track changes to the render resolution"""
+
+        self._scene_callbacks = [
+            om.MEventMessage.addEventCallback(event,
+                                              self._on_scene_changed)
+            for event in ("SceneOpened", "NewSceneOpened")
+        ]
+        self._register_node_callback()
+
+    def uninitialize(self):
+        self._remove_node_callback()
+        for callback in self._scene_callbacks:
+            try:
+                om.MMessage.removeCallback(callback)
+            except RuntimeError as error:
+                log.error("Encounter error : {}".format(error))
+
+        self._scene_callbacks = list()
+        self._render_resolution = None
+
+    def _register_node_callback(self):
+        """Listen to attribute changes of the scene's defaultResolution"""
+
+        selection = om.MSelectionList()
+        try:
+            selection.add("defaultResolution")
+        except RuntimeError:
+            return
+
+        node = om.MObject()
+        selection.getDependNode(0, node)
+        self._node_callback = om.MNodeMessage.addAttributeChangedCallback(
+            node, self._on_render_resolution_changed)
+
+    def _remove_node_callback(self):
+        if self._node_callback is None:
+            return
+
+        try:
+            om.MMessage.removeCallback(self._node_callback)
+        except RuntimeError as error:
+            log.error("Encounter error : {}".format(error))
+        self._node_callback = None
+
+    def _on_scene_changed(self, *args):
+        # The defaultResolution node is replaced with the scene
+        self._remove_node_callback()
+        self._register_node_callback()
+        self._on_render_resolution_changed()
+
+    def _on_render_resolution_changed(self, *args):
+        self._render_resolution = None
+        if self.mode.currentText() == self.ScaleRenderSettings:
+            self.on_resolution_changed()
+
+    def _get_render_resolution(self, cached=False):
+        """Return the width and height of the render settings
+
+        Args:
+            cached (bool): Whether the cached resolution may be used. This is
+                only meant for previewing in the UI, since the callback does
+                not trigger for changes through connections or render setup
+                overrides.
+
+        Returns:
+            tuple: width and height
+
+        """
+
+        if cached and self._render_resolution is not None:
+            return self._render_resolution
+
+        resolution = (cmds.getAttr("defaultResolution.width"),
+                      cmds.getAttr("defaultResolution.height"))
+
+        if self._node_callback is not None:
+            self._render_resolution = resolution
+
+        return resolution
+
     def _get_output_resolution(self):
 
-        options = self.get_outputs()
-        return int(options["width"]), int(options["height"])
+        options = self._get_scaled_resolution(cached=True)
+        return options["width"], options["height"]
 
     def on_resolution_changed(self):
+        """Update the resulting resolution label on the next event loop"""
+        self._resolution_timer.start()
+
+    def update_resolution(self):
         """Update the resulting resolution label"""
 
         width, height = self._get_output_resolution()
-        label = "Result: {0}x{1}".format(width, height)
 
-        self.scale_result.setText(label)
+        # Update labels, only when changed since it triggers a repaint
+        label = "Resolution ({0}x{1})".format(width, height)
+        if label == self.label:
+            return
+
+        self.scale_result.setText("Result: {0}x{1}".format(width, height))
 
-        # Update label
-        self.label = "Resolution ({0}x{1})".format(width, height)
+        self.label = label
         self.label_changed.emit(self.label)
 
     def get_outputs(self):
         """Return width x height defined by the combination of settings
 
+        Returns:
+            dict: width and height key values
+
+        """
+        return self._get_scaled_resolution()
+
+    def _get_scaled_resolution(self, cached=False):
+        """Return width x height defined by the combination of settings
+
+        Args:
+            cached (bool): Whether the cached render settings resolution
+                may be used, see `_get_render_resolution()`.
+
         Returns:
             dict: width and height key values
 
         """
         mode = self.mode.currentText()
-        panel = lib.get_active_editor()
 
         if mode == self.ScaleCustom:
             width = self.width.value()
@@ -155,11 +280,11 @@ class ResolutionPlugin(capture_gui.plugin.Plugin):
 
         elif mode == self.ScaleRenderSettings:
             # width height from render resolution
-            width = cmds.getAttr("defaultResolution.width")
-            height = cmds.getAttr("defaultResolution.height")
+            width, height = self._get_render_resolution(cached=cached)
 
         elif mode == self.ScaleWindow:
             # width height from active view panel size
+            panel = lib.get_active_editor()
             if not panel:
                 # No panel would be passed when updating in the UI as such
                 # the resulting resolution can't be previewed. But this should
@@ -173,11 +298,11 @@ class ResolutionPlugin(capture_gui.plugin.Plugin):
             raise NotImplementedError("Unsupported scale mode: "
                                       "{0}".format(mode))
 
-        scale = [width, height]
+        # The values are never negative so truncating floors them
         percentage = self.percent.value()
-        scale = [math.floor(x * percentage) for x in scale]
 
-        return {"width": scale[0], "height": scale[1]}
+        return {"width": int(width * percentage),
+                "height": int(height * percentage)}
 
     def get_inputs(self, as_preset):
         return {"mode": self.mode.currentText(),
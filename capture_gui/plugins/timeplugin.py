@@ -1,6 +1,6 @@
-import sys
 import logging
 import re
+from functools import partial
 
 import maya.OpenMaya as om
 from capture_gui.vendor.Qt import QtCore, QtWidgets
@@ -10,6 +10,10 @@ import capture_gui.plugin
 
 log = logging.getLogger("Time Range")
 
+# QSpinBox values are limited to a 32-bit signed integer
+FRAME_MIN = -2 ** 31
+FRAME_MAX = 2 ** 31 - 1
+
 
 def parse_frames(string):
     """Parse the resulting frames list from a frame list string.
@@ -85,7 +89,18 @@ class TimePlugin(capture_gui.plugin.Plugin):
     def __init__(self, parent=None):
         super(TimePlugin, self).__init__(parent=parent)
 
-        self._event_callbacks = list()
+        # Maya event callbacks by event name, these are only registered
+        # for the events the current mode depends on
+        self._event_callbacks = dict()
+        self._callbacks_enabled = False
+
+        # Coalesce bursts of Maya events (e.g. scrubbing or playback) into
+        # at most one refresh per interval
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(partial(self.on_mode_changed,
+                                                    emit=False))
 
         self._layout = QtWidgets.QHBoxLayout()
         self._layout.setContentsMargins(5, 0, 5, 0)
@@ -99,11 +114,13 @@ class TimePlugin(capture_gui.plugin.Plugin):
 
         frame_input_height = 20
         self.start = QtWidgets.QSpinBox()
-        self.start.setRange(-sys.maxint, sys.maxint)
+        self.start.setRange(FRAME_MIN, FRAME_MAX)
         self.start.setFixedHeight(frame_input_height)
+        self.start.setKeyboardTracking(False)
         self.end = QtWidgets.QSpinBox()
-        self.end.setRange(-sys.maxint, sys.maxint)
+        self.end.setRange(FRAME_MIN, FRAME_MAX)
         self.end.setFixedHeight(frame_input_height)
+        self.end.setKeyboardTracking(False)
 
         # unique frames field
         self.custom_frames = QtWidgets.QLineEdit()
@@ -178,9 +195,13 @@ class TimePlugin(capture_gui.plugin.Plugin):
             currentframe = int(capture_gui.lib.get_current_frame())
             mode_values = "({})".format(currentframe)
 
-        # Update label
-        self.label = "Time Range {}".format(mode_values)
-        self.label_changed.emit(self.label)
+        # Update label, only when changed since it triggers a repaint
+        label = "Time Range {}".format(mode_values)
+        if label != self.label:
+            self.label = label
+            self.label_changed.emit(label)
+
+        self._update_callbacks()
 
         if emit:
             self.options_changed.emit()
@@ -252,41 +273,71 @@ class TimePlugin(capture_gui.plugin.Plugin):
         endframe = settings.get("end_frame", 120)
         custom_frames = settings.get("frame", None)
 
-        # set values
-        self.mode.setCurrentIndex(mode)
-        self.start.setValue(int(startframe))
-        self.end.setValue(int(endframe))
-        if custom_frames is not None:
-            self.custom_frames.setText(custom_frames)
+        # set values with signals blocked so the GUI is only updated once
+        # after all values are set
+        with capture_gui.lib.signals_blocked(self.mode,
+                                             self.start,
+                                             self.end,
+                                             self.custom_frames):
+            self.mode.setCurrentIndex(mode)
+            self.start.setValue(int(startframe))
+            self.end.setValue(int(endframe))
+            if custom_frames is not None:
+                self.custom_frames.setText(custom_frames)
+
+            # The signals that keep start and end in order are blocked,
+            # so ensure the start is never higher than the end here
+            self._ensure_start(self.end.value())
+
+        self.on_mode_changed()
 
     def initialize(self):
-        self._register_callbacks()
+        self._callbacks_enabled = True
+        self._update_callbacks()
 
     def uninitialize(self):
-        self._remove_callbacks()
+        self._callbacks_enabled = False
+        self._update_callbacks()
+
+    def _on_maya_event(self, *args):
+        # Don't restart a pending refresh so it is not postponed
+        # indefinitely while the events keep coming in during playback
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
 
-    def _register_callbacks(self):
+    def _update_callbacks(self):
         """
         Register callbacks to ensure Capture GUI reacts to changes in
-        the Maya GUI in regards to time slider and current frame
+        the Maya GUI in regards to time slider and current frame.
+
+        Only the events the current mode depends on are listened to, so
+        for example no callback runs on each frame during playback unless
+        the mode is set to the current frame.
         :return: None
         """
 
-        callback = lambda x: self.on_mode_changed(emit=False)
-
-        # this avoid overriding the ids on re-run
-        currentframe = om.MEventMessage.addEventCallback("timeChanged",
-                                                         callback)
-        timerange = om.MEventMessage.addEventCallback("playbackRangeChanged",
-                                                      callback)
-
-        self._event_callbacks.append(currentframe)
-        self._event_callbacks.append(timerange)
-
-    def _remove_callbacks(self):
-        """Remove callbacks when closing widget"""
-        for callback in self._event_callbacks:
+        events = set()
+        if self._callbacks_enabled:
+            mode = self.mode.currentText()
+            if mode == self.CurrentFrame:
+                events.add("timeChanged")
+            elif mode == self.RangeTimeSlider:
+                events.add("playbackRangeChanged")
+
+        # Remove callbacks that are no longer required
+        for event in list(self._event_callbacks):
+            if event in events:
+                continue
+            callback = self._event_callbacks.pop(event)
             try:
                 om.MEventMessage.removeCallback(callback)
-            except RuntimeError, error:
+            except RuntimeError as error:
                 log.error("Encounter error : {}".format(error))
+
+        # Add the missing callbacks
+        for event in events:
+            if event in self._event_callbacks:
+                continue
+            callback = om.MEventMessage.addEventCallback(
+                event, self._on_maya_event)
+            self._event_callbacks[event] = callback
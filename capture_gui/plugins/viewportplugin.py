@@ -4,6 +4,16 @@ import capture_gui.lib as lib
 import capture
 
 
+def _copy_outputs(outputs):
+    """Return a copy of the overridden viewport outputs
+
+    The outputs only hold dictionaries of plain values per option group,
+    so copying each group is enough.
+
+    """
+    return {key: dict(value) for key, value in outputs.items()}
+
+
 class ViewportPlugin(capture_gui.plugin.Plugin):
 
     """Plugin to apply viewport visibilities and settings"""
@@ -22,9 +32,21 @@ class ViewportPlugin(capture_gui.plugin.Plugin):
         # custom atttributes
         self.show_type_actions = list()
 
+        # pairs of (system name, action) of the show menu to avoid looking
+        # up the name through the action's text
+        self._show_type_items = list()
+
+        # Outputs of the overridden viewport settings, these only depend
+        # on the widget's state so they are kept until the options change
+        self._outputs_cache = None
+
         # get information
         self.show_types = lib.get_show_object_types()
 
+        # checked states of the object types until the show menu's actions
+        # are created, after that the actions hold the state
+        self._show_states = dict.fromkeys(self.show_types.values(), False)
+
         # set main layout for widget
         self._layout = QtWidgets.QVBoxLayout()
         self._layout.setContentsMargins(0, 0, 0, 0)
@@ -79,6 +101,8 @@ class ViewportPlugin(capture_gui.plugin.Plugin):
 
     def connections(self):
 
+        self.options_changed.connect(self._clear_outputs_cache)
+
         self.high_quality.stateChanged.connect(self.options_changed)
         self.override_viewport.stateChanged.connect(self.options_changed)
         self.override_viewport.stateChanged.connect(self.on_toggle_override)
@@ -90,7 +114,9 @@ class ViewportPlugin(capture_gui.plugin.Plugin):
 
     def _build_show_menu(self):
         """Build the menu to select which object types are shown in the output.
-        
+
+        The actions of the menu are created when it is first shown.
+
         Returns:
             QtGui.QMenu: The visibilities "show" menu.
             
@@ -101,6 +127,17 @@ class ViewportPlugin(capture_gui.plugin.Plugin):
         menu.setWindowTitle("Show")
         menu.setFixedWidth(180)
         menu.setTearOffEnabled(True)
+        menu.aboutToShow.connect(self._populate_show_menu)
+
+        return menu
+
+    def _populate_show_menu(self):
+        """Create the actions of the show menu if not created yet"""
+
+        if self._show_type_items:
+            return
+
+        menu = self.show_types_menu
 
         # Show all check
         toggle_all = QtWidgets.QAction(menu, text="All")
@@ -110,20 +147,22 @@ class ViewportPlugin(capture_gui.plugin.Plugin):
         menu.addSeparator()
 
         # add plugin shapes if any
-        for shape in self.show_types:
+        for shape, system_name in self.show_types.items():
             action = QtWidgets.QAction(menu, text=shape)
             action.setCheckable(True)
+            action.setChecked(self._show_states[system_name])
             # emit signal when the state is changed of the checkbox
             action.toggled.connect(self.options_changed)
-            menu.addAction(action)
             self.show_type_actions.append(action)
+            self._show_type_items.append((system_name, action))
+
+        # add all actions at once to lay out the menu a single time
+        menu.addActions(self.show_type_actions)
 
         # connect signals
         toggle_all.triggered.connect(self.toggle_all_visbile)
         toggle_none.triggered.connect(self.toggle_all_hide)
 
-        return menu
-
     def _build_light_menu(self):
         """
         Create the menu items for the different types of lighting for
@@ -157,13 +196,25 @@ class ViewportPlugin(capture_gui.plugin.Plugin):
 
     def toggle_all_visbile(self):
         """Set all object types off or on depending on the state"""
-        for action in self.show_type_actions:
-            action.setChecked(True)
+        self._set_all_show_types(True)
 
     def toggle_all_hide(self):
         """Set all object types off or on depending on the state"""
-        for action in self.show_type_actions:
-            action.setChecked(False)
+        self._set_all_show_types(False)
+
+    def _set_all_show_types(self, state):
+        """Set the checked state of all object types with a single change
+
+        :param state: Whether the object types should be shown
+        :type state: bool
+
+        :return: None
+        """
+        with lib.signals_blocked(*self.show_type_actions):
+            for action in self.show_type_actions:
+                action.setChecked(state)
+
+        self.options_changed.emit()
 
     def get_show_inputs(self):
         """
@@ -173,16 +224,12 @@ class ViewportPlugin(capture_gui.plugin.Plugin):
         :rtype: dict
         """
 
-        show_inputs = {}
-        # get all checked objects
-        for action in self.show_type_actions:
-            label = action.text()
-            name = self.show_types.get(label, None)
-            if name is None:
-                continue
-            show_inputs[name] = action.isChecked()
+        if not self._show_type_items:
+            return dict(self._show_states)
 
-        return show_inputs
+        # get all checked objects
+        return {name: action.isChecked() for name, action
+                in self._show_type_items}
 
     def get_displaylights(self):
         """
@@ -234,19 +281,36 @@ class ViewportPlugin(capture_gui.plugin.Plugin):
         two_sided_ligthing = inputs.get("twoSidedLighting", False)
         shadows = inputs.get("shadows", False)
 
-        self.high_quality.setChecked(high_quality)
-        self.override_viewport.setChecked(override_viewport)
-        self.show_types_button.setEnabled(override_viewport)
-
-        # display light menu
-        self.display_light_menu.setCurrentIndex(displaylight)
-        self.shadows.setChecked(shadows)
-        self.two_sided_ligthing.setChecked(two_sided_ligthing)
-
-        for action in self.show_type_actions:
-            system_name = self.show_types[action.text()]
-            state = inputs.get(system_name, True)
-            action.setChecked(state)
+        # Apply all values with signals blocked to emit a single change
+        widgets = [self.high_quality,
+                   self.override_viewport,
+                   self.display_light_menu,
+                   self.shadows,
+                   self.two_sided_ligthing]
+        widgets.extend(self.show_type_actions)
+        with lib.signals_blocked(*widgets):
+            self.high_quality.setChecked(high_quality)
+            self.override_viewport.setChecked(override_viewport)
+
+            # display light menu
+            self.display_light_menu.setCurrentIndex(displaylight)
+            self.shadows.setChecked(shadows)
+            self.two_sided_ligthing.setChecked(two_sided_ligthing)
+
+            for system_name, action in self._show_type_items:
+                state = inputs.get(system_name, True)
+                action.setChecked(state)
+
+            if not self._show_type_items:
+                for system_name in self._show_states:
+                    self._show_states[system_name] = inputs.get(system_name,
+                                                                True)
+
+        self.on_toggle_override()
+        self.options_changed.emit()
+
+    def _clear_outputs_cache(self):
+        self._outputs_cache = None
 
     def get_outputs(self):
         """
@@ -262,6 +326,11 @@ class ViewportPlugin(capture_gui.plugin.Plugin):
         override_viewport_options = self.override_viewport.isChecked()
 
         if override_viewport_options:
+            # The outputs are merged into other plug-ins' outputs by the
+            # application so never return the cached dictionaries directly
+            if self._outputs_cache is not None:
+                return _copy_outputs(self._outputs_cache)
+
             outputs['viewport2_options'] = dict()
             outputs['viewport_options'] = dict()
 
@@ -275,6 +344,8 @@ class ViewportPlugin(capture_gui.plugin.Plugin):
             display_lights = self.get_displaylights()
             outputs['viewport_options'].update(show_per_type)
             outputs['viewport_options'].update(display_lights)
+
+            self._outputs_cache = _copy_outputs(outputs)
         else:
             # TODO: When this fails we should give the user a warning
             # Use settings from the active viewport
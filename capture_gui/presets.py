@@ -3,6 +3,8 @@ import os
 import logging
 
 _registered_paths = []
+_discover_cache = dict()
+_default_registered = False
 log = logging.getLogger("Presets")
 
 
@@ -17,18 +19,21 @@ def discover(paths=None):
     :rtype: list
     """
 
+    _ensure_default_registered()
+
     presets = []
+    seen = set()
     for path in paths or preset_paths():
         path = os.path.normpath(path)
         if not os.path.isdir(path):
             continue
 
-        # check for json files
-        glob_query = os.path.abspath(os.path.join(path, "*.json"))
-        filenames = glob.glob(glob_query)
-        for filename in filenames:
+        for filename in _list_json_files(path):
             # skip private files
-            if filename.startswith("_"):
+            if os.path.basename(filename).startswith("_"):
+                continue
+
+            if filename in seen:
                 continue
 
             # check for file size
@@ -37,12 +42,43 @@ def discover(paths=None):
                                "for file '{}'".format(filename))
                 continue
 
-            if filename not in presets:
-                presets.append(filename)
+            seen.add(filename)
+            presets.append(filename)
 
     return presets
 
 
+def _list_json_files(path):
+    """
+    Return the json files in the directory
+
+    The result is cached until the modification time of the directory
+    changes, which happens when files are added, removed or renamed.
+
+    :param path: the directory to list the json files for
+    :type path: str
+
+    :return: list of absolute file paths
+    :rtype: list
+    """
+
+    mtime = os.stat(path).st_mtime
+    cached = _discover_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    glob_query = os.path.abspath(os.path.join(path, "*.json"))
+    filenames = glob.glob(glob_query)
+    _discover_cache[path] = (mtime, filenames)
+
+    return filenames
+
+
+def clear_cache():
+    """Clear the cached directory listings used by `discover`"""
+    _discover_cache.clear()
+
+
 def check_file_size(filepath):
     """
     Check if filesize of the given file is bigger than 1.0 byte
@@ -53,10 +89,7 @@ def check_file_size(filepath):
     :return: 
     """
 
-    file_stats = os.stat(filepath)
-    if file_stats.st_size < 1:
-        return False
-    return True
+    return os.path.getsize(filepath) >= 1
 
 
 def preset_paths():
@@ -67,10 +100,14 @@ def preset_paths():
     :rtype: list
     """
 
+    _ensure_default_registered()
+
     paths = list()
+    seen = set()
     for path in _registered_paths:
-        if path in paths:
+        if path in seen:
             continue
+        seen.add(path)
         paths.append(path)
 
     return paths
@@ -93,6 +130,21 @@ def register_preset_path(path):
     return path
 
 
-user_folder = os.path.expanduser("~")
-capture_gui_presets = os.path.join(user_folder, "CaptureGUI", "presets")
-register_preset_path(capture_gui_presets)
+def _ensure_default_registered():
+    """
+    Register the user's default preset folder on first use
+
+    The folder is registered first so it keeps precedence over paths
+    registered before the first lookup, as it did when registered at import.
+
+    :return: None
+    """
+    global _default_registered
+    if _default_registered:
+        return
+    _default_registered = True
+
+    user_folder = os.path.expanduser("~")
+    capture_gui_presets = os.path.join(user_folder, "CaptureGUI", "presets")
+    if capture_gui_presets not in _registered_paths:
+        _registered_paths.insert(0, capture_gui_presets)
@@ -4,9 +4,14 @@ The capture gui application will format tokens in the filename.
 The tokens can be registered using `register_token`
 
 """
+import re
+
 from . import lib
 
 _registered_tokens = dict()
+_token_labels = None
+_token_pattern = None
+_token_funcs = None
 
 
 def format_tokens(string, options):
@@ -23,27 +28,69 @@ def format_tokens(string, options):
     :rtype: str
     """
 
-    if not string:
+    global _token_pattern, _token_funcs
+
+    if not string or not _registered_tokens:
+        return string
+
+    # All tokens start with "<" so without it there is nothing to replace
+    if "<" not in string:
         return string
 
-    for token, value in _registered_tokens.items():
-        if token in string:
-            func = value['func']
-            string = string.replace(token, func(options))
+    # Match all registered tokens in a single pass over the string, the
+    # token functions are only called for the tokens that are present
+    if _token_pattern is None:
+        _token_funcs = dict((token, value['func']) for token, value
+                            in _registered_tokens.items())
+        _token_pattern = re.compile("|".join(re.escape(token) for token
+                                             in _token_funcs))
 
-    return string
+    funcs = _token_funcs
+
+    def replace(match):
+        return funcs[match.group(0)](options)
+
+    return _token_pattern.sub(replace, string)
 
 
 def register_token(token, func, label=""):
     assert token.startswith("<") and token.endswith(">")
     assert callable(func)
     _registered_tokens[token] = {"func": func, "label": label}
+    invalidate()
 
 
 def list_tokens():
     return _registered_tokens.copy()
 
 
+def list_token_labels():
+    """
+    Return the registered tokens with their label
+
+    The result is cached until the registered tokens change, as such the
+    same tuple is returned as long as the registry is unchanged.
+
+    :return: pairs of token and label
+    :rtype: tuple
+    """
+    global _token_labels
+
+    if _token_labels is None:
+        _token_labels = tuple((token, value['label']) for token, value
+                              in _registered_tokens.items())
+
+    return _token_labels
+
+
+def invalidate():
+    """Clear the cached token data after the registry has changed"""
+    global _token_labels, _token_pattern, _token_funcs
+    _token_labels = None
+    _token_pattern = None
+    _token_funcs = None
+
+
 # register default tokens
 # scene based tokens
 def _camera_token(options):
@@ -3,7 +3,8 @@ VERSION_MINOR = 5
 VERSION_PATCH = 0
 
 
-version = '{}.{}.{}'.format(VERSION_MAJOR, VERSION_MINOR, VERSION_PATCH)
+version_info = (VERSION_MAJOR, VERSION_MINOR, VERSION_PATCH)
+version = '{}.{}.{}'.format(*version_info)
 __version__ = version
 
 __all__ = ['version', 'version_info', '__version__']